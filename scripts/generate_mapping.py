@@ -15,6 +15,7 @@ Options:
     --output-file FILENAME      Output JSON filename (default: EpanetBridge.json)
     --quality                   Include water quality outputs for all nodes/links
     --logging-level LEVEL       Set logging level (OFF, ERROR, INFO, DEBUG)
+    --compact                   Write compact JSON (no indentation or extra whitespace)
 
 Examples:
     # Generate with default outputs (all tanks, junctions, links)
@@ -30,14 +31,65 @@ Requirements: 6.1, 6.2, 6.3, 6.4, 6.5, 6.6, 6.7, 6.8
 """
 
 import argparse
+import functools
 import hashlib
+import io
 import json
 import os
-import re
 import sys
 from typing import Dict, List, Tuple, Optional
 
 
+# Object types
+_NODE = sys.intern("NODE")
+_LINK = sys.intern("LINK")
+_PATTERN = sys.intern("PATTERN")
+_SYSTEM = sys.intern("SYSTEM")
+
+# Properties
+_DEMAND = sys.intern("DEMAND")
+_STATUS = sys.intern("STATUS")
+_SETTING = sys.intern("SETTING")
+_MULTIPLIER = sys.intern("MULTIPLIER")
+_PRESSURE = sys.intern("PRESSURE")
+_HEAD = sys.intern("HEAD")
+_TANKLEVEL = sys.intern("TANKLEVEL")
+_QUALITY = sys.intern("QUALITY")
+_FLOW = sys.intern("FLOW")
+_VELOCITY = sys.intern("VELOCITY")
+_HEADLOSS = sys.intern("HEADLOSS")
+_ELAPSEDTIME = sys.intern("ELAPSEDTIME")
+
+# Valid properties by object type
+_EMPTY = frozenset()
+_INPUT_PROPS = {
+    _NODE: frozenset({_DEMAND}),
+    _LINK: frozenset({_STATUS, _SETTING}),
+    _PATTERN: frozenset({_MULTIPLIER})
+}
+_OUTPUT_PROPS = {
+    _NODE: frozenset({_PRESSURE, _HEAD, _DEMAND, _TANKLEVEL, _QUALITY}),
+    _LINK: frozenset({_FLOW, _VELOCITY, _HEADLOSS, _STATUS, _SETTING, _QUALITY})
+}
+
+
+class _HashingReader(io.RawIOBase):
+    """Raw binary reader that feeds every byte read from f to the md5 hash"""
+    
+    def __init__(self, f, md5):
+        self._f = f
+        self._md5 = md5
+    
+    def readable(self) -> bool:
+        return True
+    
+    def readinto(self, b) -> int:
+        n = self._f.readinto(b)
+        if n:
+            self._md5.update(memoryview(b)[:n])
+        return n
+
+
 class EpanetInpParser:
     """Parser for EPANET .inp files"""
     
@@ -52,17 +104,69 @@ class EpanetInpParser:
         self.patterns: List[str] = []
         self.hydraulic_timestep: int = 3600  # Default 1 hour
         self.quality_enabled: bool = False  # Whether water quality simulation is enabled
+        self.file_hash: Optional[str] = None  # MD5 hash of the file, computed while parsing
         
     def parse(self) -> bool:
         """
         Parse the EPANET .inp file and extract all element IDs
         
+        The file is read in a single pass: every byte read is fed to the MD5
+        hash, section headers switch the current section and every data line
+        is dispatched to that section's handler.
+        
         Returns:
             True if parsing succeeded, False otherwise
         """
+        # Sections whose first column holds element IDs
+        id_sections = {
+            '[JUNCTIONS]': self.junctions,
+            '[RESERVOIRS]': self.reservoirs,
+            '[TANKS]': self.tanks,
+            '[PIPES]': self.pipes,
+            '[PUMPS]': self.pumps,
+            '[VALVES]': self.valves,
+            '[PATTERNS]': self.patterns,
+        }
+        
+        md5 = hashlib.md5()
         try:
-            with open(self.inp_file, 'r') as f:
-                content = f.read()
+            with open(self.inp_file, 'rb') as f, \
+                    io.TextIOWrapper(io.BufferedReader(_HashingReader(f, md5)),
+                                     encoding='utf-8-sig', errors='replace', newline=None) as text:
+                # Bound append of the current ID section (None outside ID sections)
+                append_id = None
+                mode = None
+                for raw in text:
+                    # Remove comments
+                    line = raw.partition(';')[0].strip()
+                    if not line:
+                        continue
+                    
+                    # Section header: switch the current section
+                    if line[0] == '[':
+                        header = line.upper()
+                        current_list = id_sections.get(header)
+                        append_id = current_list.append if current_list is not None else None
+                        mode = header if header in ('[TIMES]', '[OPTIONS]') else None
+                        continue
+                    
+                    if append_id is not None:
+                        # Extract first column (element ID)
+                        append_id(line.split(None, 1)[0])
+                    elif mode == '[TIMES]':
+                        # Check if this is the hydraulic timestep line
+                        low = line.lower()
+                        if low.startswith('hydraulic') and 'timestep' in low:
+                            parts = line.split(None, 3)
+                            if len(parts) >= 3:
+                                # Parse time value (format: "Hydraulic Timestep 0:05" or "Hydraulic Timestep 0:05:00")
+                                self.hydraulic_timestep = self._parse_time_string(parts[2])
+                    elif mode == '[OPTIONS]':
+                        # Quality is enabled if it's not NONE (NONE, CHEMICAL, AGE, TRACE)
+                        if line.lower().startswith('quality'):
+                            parts = line.split(None, 2)
+                            if len(parts) >= 2:
+                                self.quality_enabled = (parts[1].upper() != 'NONE')
         except FileNotFoundError:
             print(f"ERROR: Input file '{self.inp_file}' not found", file=sys.stderr)
             return False
@@ -70,80 +174,9 @@ class EpanetInpParser:
             print(f"ERROR: Failed to read input file: {e}", file=sys.stderr)
             return False
         
-        # Parse each section
-        self._parse_section(content, '[JUNCTIONS]', self.junctions)
-        self._parse_section(content, '[RESERVOIRS]', self.reservoirs)
-        self._parse_section(content, '[TANKS]', self.tanks)
-        self._parse_section(content, '[PIPES]', self.pipes)
-        self._parse_section(content, '[PUMPS]', self.pumps)
-        self._parse_section(content, '[VALVES]', self.valves)
-        self._parse_section(content, '[PATTERNS]', self.patterns)
-        self._parse_times_section(content)
-        self._parse_quality_section(content)
-        
+        self.file_hash = md5.hexdigest()
         return True
     
-    def _parse_section(self, content: str, section_name: str, output_list: List[str]):
-        """Parse a section and extract element IDs (first column)"""
-        # Find section start
-        section_match = re.search(rf'{re.escape(section_name)}', content, re.IGNORECASE)
-        if not section_match:
-            return
-        
-        # Find section end (next section or end of file)
-        section_start = section_match.end()
-        next_section = re.search(r'\n\[', content[section_start:])
-        if next_section:
-            section_end = section_start + next_section.start()
-        else:
-            section_end = len(content)
-        
-        section_content = content[section_start:section_end]
-        
-        # Parse lines
-        for line in section_content.split('\n'):
-            # Remove comments
-            line = line.split(';')[0].strip()
-            if not line:
-                continue
-            
-            # Extract first column (element ID)
-            parts = line.split()
-            if parts:
-                element_id = parts[0]
-                output_list.append(element_id)
-    
-    def _parse_times_section(self, content: str):
-        """Parse [TIMES] section to extract HYDRAULIC TIMESTEP"""
-        section_match = re.search(r'\[TIMES\]', content, re.IGNORECASE)
-        if not section_match:
-            return
-        
-        section_start = section_match.end()
-        next_section = re.search(r'\n\[', content[section_start:])
-        if next_section:
-            section_end = section_start + next_section.start()
-        else:
-            section_end = len(content)
-        
-        section_content = content[section_start:section_end]
-        
-        # Look for "Hydraulic Timestep" line
-        for line in section_content.split('\n'):
-            # Remove comments
-            line = line.split(';')[0].strip()
-            if not line:
-                continue
-            
-            # Check if this is the hydraulic timestep line
-            if re.match(r'Hydraulic\s+Timestep', line, re.IGNORECASE):
-                parts = line.split()
-                if len(parts) >= 3:
-                    # Parse time value (format: "Hydraulic Timestep 0:05" or "Hydraulic Timestep 0:05:00")
-                    time_str = parts[2]
-                    self.hydraulic_timestep = self._parse_time_string(time_str)
-                    break
-    
     def _parse_time_string(self, time_str: str) -> int:
         """
         Parse EPANET time string to seconds
@@ -157,57 +190,18 @@ class EpanetInpParser:
         Returns:
             Time in seconds
         """
-        parts = time_str.split(':')
-        if len(parts) == 2:
-            # Format: H:MM
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            return hours * 3600 + minutes * 60
-        elif len(parts) == 3:
-            # Format: H:MM:SS
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = int(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-        else:
-            # Default to 1 hour if parsing fails
+        hours, _, rest = time_str.partition(':')
+        if not rest:
+            # Not an H:MM[:SS] value - default to 1 hour
             return 3600
-    
-    def _parse_quality_section(self, content: str):
-        """
-        Parse [OPTIONS] section to detect if water quality simulation is enabled
-        
-        Water quality is enabled if the Quality option is set to anything other than NONE.
-        Possible values: NONE, CHEMICAL, AGE, TRACE
-        """
-        section_match = re.search(r'\[OPTIONS\]', content, re.IGNORECASE)
-        if not section_match:
-            return
-        
-        section_start = section_match.end()
-        next_section = re.search(r'\n\[', content[section_start:])
-        if next_section:
-            section_end = section_start + next_section.start()
-        else:
-            section_end = len(content)
         
-        section_content = content[section_start:section_end]
-        
-        # Look for "Quality" line
-        for line in section_content.split('\n'):
-            # Remove comments
-            line = line.split(';')[0].strip()
-            if not line:
-                continue
-            
-            # Check if this is the quality option line
-            if re.match(r'Quality', line, re.IGNORECASE):
-                parts = line.split()
-                if len(parts) >= 2:
-                    quality_type = parts[1].upper()
-                    # Quality is enabled if it's not NONE
-                    self.quality_enabled = (quality_type != 'NONE')
-                    break
+        # Format: H:MM or H:MM:SS
+        minutes, _, seconds = rest.partition(':')
+        try:
+            return int(hours) * 3600 + int(minutes) * 60 + (int(seconds) if seconds else 0)
+        except ValueError:
+            # Default to 1 hour if parsing fails
+            return 3600
     
     def get_all_nodes(self) -> List[str]:
         """Get all node IDs (junctions + reservoirs + tanks)"""
@@ -218,92 +212,147 @@ class EpanetInpParser:
         return self.pipes + self.pumps + self.valves
 
 
+class MappingEntry:
+    """Single input or output mapping (one object in the JSON inputs/outputs arrays)"""
+    
+    __slots__ = ('index', 'name', 'object_type', 'property')
+    
+    def __init__(self, index: int, name: str, object_type: str, property_name: str):
+        self.index = index
+        self.name = name
+        self.object_type = object_type
+        self.property = property_name
+
+
+# JSON templates for one mapping entry, matching json's indent=2 and compact layouts
+_ENTRY_INDENTED = ('    {\n'
+                   '      "index": %d,\n'
+                   '      "name": %s,\n'
+                   '      "object_type": %s,\n'
+                   '      "property": %s\n'
+                   '    }')
+_ENTRY_COMPACT = '{"index":%d,"name":%s,"object_type":%s,"property":%s}'
+
+
+def _write_mapping_array(f, entries: List[MappingEntry], compact: bool):
+    """Write a JSON array of mapping entries, formatting each entry from a fixed template"""
+    if not entries:
+        f.write('[]')
+        return
+    
+    if compact:
+        template, sep, start, end = _ENTRY_COMPACT, ',', '[', ']'
+    else:
+        template, sep, start, end = _ENTRY_INDENTED, ',\n', '[\n', '\n  ]'
+    
+    encode = json.encoder.encode_basestring
+    chunks = (template % (e.index, encode(e.name), encode(e.object_type), encode(e.property))
+              for e in entries)
+    f.write(start)
+    f.write(next(chunks))
+    f.writelines(sep + chunk for chunk in chunks)
+    f.write(end)
+
+
 class MappingGenerator:
     """Generator for EPANET-GoldSim Bridge JSON configuration"""
     
     def __init__(self, parser: EpanetInpParser, inp_file: str):
         self.parser = parser
         self.inp_file = inp_file
-        self.inputs: List[Dict] = []
-        self.outputs: List[Dict] = []
+        self.inputs: List[MappingEntry] = []
+        self.outputs: List[MappingEntry] = []
+        
+    @functools.cached_property
+    def _object_types(self) -> Dict[str, str]:
+        """
+        Element ID -> object type map, built on first use (custom inputs/outputs only)
         
-    def add_input(self, element_spec: str) -> bool:
+        Filled in reverse priority so an ID shared by a node and a link/pattern
+        resolves to NODE.
+        """
+        parser = self.parser
+        object_types = dict.fromkeys(parser.patterns, _PATTERN)
+        for link_ids in (parser.pipes, parser.pumps, parser.valves):
+            object_types.update(dict.fromkeys(link_ids, _LINK))
+        for node_ids in (parser.junctions, parser.reservoirs, parser.tanks):
+            object_types.update(dict.fromkeys(node_ids, _NODE))
+        return object_types
+    
+    def add_input(self, element_id: str, property_name: str) -> bool:
         """
-        Add an input mapping from specification string
+        Add an input mapping
         
-        Format: "ELEMENT_ID:PROPERTY"
-        Example: "TANK_1:DEMAND", "PUMP_1:SETTING"
+        Example: ("TANK_1", "DEMAND"), ("PUMP_1", "SETTING")
         
         Returns:
             True if input was added successfully, False otherwise
         """
-        parts = element_spec.split(':')
-        if len(parts) != 2:
-            print(f"ERROR: Invalid input specification '{element_spec}'. Expected format: ELEMENT_ID:PROPERTY", 
-                  file=sys.stderr)
-            return False
-        
-        element_id, property_name = parts
-        
-        # Determine object type
-        object_type = self._get_object_type(element_id)
-        if not object_type:
-            print(f"ERROR: Element '{element_id}' not found in EPANET model", file=sys.stderr)
-            return False
-        
-        # Validate property for object type
-        if not self._is_valid_input_property(object_type, property_name):
-            print(f"ERROR: Property '{property_name}' is not valid for {object_type} inputs", file=sys.stderr)
-            return False
-        
-        # Add input (index will be set later)
-        self.inputs.append({
-            "index": len(self.inputs) + 1,  # +1 for ElapsedTime at index 0
-            "name": element_id,
-            "object_type": object_type,
-            "property": property_name
-        })
-        
-        return True
+        return _report_errors(self.add_inputs_bulk([(element_id, property_name)]))
     
-    def add_output(self, element_spec: str) -> bool:
+    def add_output(self, element_id: str, property_name: str) -> bool:
         """
-        Add an output mapping from specification string
+        Add an output mapping
         
-        Format: "ELEMENT_ID:PROPERTY"
-        Example: "JUNCTION_1:PRESSURE", "PIPE_1:FLOW"
+        Example: ("JUNCTION_1", "PRESSURE"), ("PIPE_1", "FLOW")
         
         Returns:
             True if output was added successfully, False otherwise
         """
-        parts = element_spec.split(':')
-        if len(parts) != 2:
-            print(f"ERROR: Invalid output specification '{element_spec}'. Expected format: ELEMENT_ID:PROPERTY", 
-                  file=sys.stderr)
-            return False
+        return _report_errors(self.add_outputs_bulk([(element_id, property_name)]))
+    
+    def add_inputs_bulk(self, element_specs: List[Tuple[str, str]]) -> List[str]:
+        """
+        Add input mappings from a list of (element ID, property) pairs
         
-        element_id, property_name = parts
+        Every specification is validated; the valid ones are added in order.
         
-        # Determine object type
-        object_type = self._get_object_type(element_id)
-        if not object_type:
-            print(f"ERROR: Element '{element_id}' not found in EPANET model", file=sys.stderr)
-            return False
+        Returns:
+            List of error messages (empty if all inputs were added)
+        """
+        # +1 for ElapsedTime at index 0
+        return self._add_mappings(element_specs, self.inputs, len(self.inputs) + 1,
+                                  "input", self._is_valid_input_property)
+    
+    def add_outputs_bulk(self, element_specs: List[Tuple[str, str]]) -> List[str]:
+        """
+        Add output mappings from a list of (element ID, property) pairs
         
-        # Validate property for object type
-        if not self._is_valid_output_property(object_type, property_name):
-            print(f"ERROR: Property '{property_name}' is not valid for {object_type} outputs", file=sys.stderr)
-            return False
+        Every specification is validated; the valid ones are added in order.
+        
+        Returns:
+            List of error messages (empty if all outputs were added)
+        """
+        return self._add_mappings(element_specs, self.outputs, len(self.outputs),
+                                  "output", self._is_valid_output_property)
+    
+    def _add_mappings(self, element_specs: List[Tuple[str, str]], mappings: List[MappingEntry],
+                      first_index: int, kind: str, is_valid_property) -> List[str]:
+        """Validate specifications and extend mappings with the valid ones"""
+        errors: List[str] = []
+        valid: List[Tuple[str, str, str]] = []
+        for element_id, property_name in element_specs:
+            # Determine object type
+            object_type = self._get_object_type(element_id)
+            if not object_type:
+                errors.append(f"Element '{element_id}' not found in EPANET model")
+                continue
+            
+            # Validate property for object type
+            if not is_valid_property(object_type, property_name):
+                errors.append(f"Property '{property_name}' is not valid for {object_type} {kind}s")
+                continue
+            
+            # Share the interned property string across entries
+            valid.append((element_id, object_type, sys.intern(property_name)))
         
-        # Add output
-        self.outputs.append({
-            "index": len(self.outputs),
-            "name": element_id,
-            "object_type": object_type,
-            "property": property_name
-        })
+        append = mappings.append
+        index = first_index
+        for element_id, object_type, property_name in valid:
+            append(MappingEntry(index, element_id, object_type, property_name))
+            index += 1
         
-        return True
+        return errors
     
     def generate_default_outputs(self, include_quality: bool = False):
         """
@@ -313,75 +362,46 @@ class MappingGenerator:
             include_quality: If True, also add QUALITY outputs for all nodes and links
         """
         # Add tank levels
-        for tank in self.parser.tanks:
-            self.outputs.append({
-                "index": len(self.outputs),
-                "name": tank,
-                "object_type": "NODE",
-                "property": "TANKLEVEL"
-            })
+        self._extend_outputs(self.parser.tanks, _NODE, _TANKLEVEL)
         
         # Add junction pressures
-        for junction in self.parser.junctions:
-            self.outputs.append({
-                "index": len(self.outputs),
-                "name": junction,
-                "object_type": "NODE",
-                "property": "PRESSURE"
-            })
+        self._extend_outputs(self.parser.junctions, _NODE, _PRESSURE)
         
         # Add link flows
-        for link in self.parser.get_all_links():
-            self.outputs.append({
-                "index": len(self.outputs),
-                "name": link,
-                "object_type": "LINK",
-                "property": "FLOW"
-            })
+        self._extend_outputs(self.parser.get_all_links(), _LINK, _FLOW)
         
         # Add quality outputs if requested
         if include_quality:
-            for node in self.parser.get_all_nodes():
-                self.outputs.append({
-                    "index": len(self.outputs),
-                    "name": node,
-                    "object_type": "NODE",
-                    "property": "QUALITY"
-                })
-            
-            for link in self.parser.get_all_links():
-                self.outputs.append({
-                    "index": len(self.outputs),
-                    "name": link,
-                    "object_type": "LINK",
-                    "property": "QUALITY"
-                })
-    
-    def generate_json(self, output_file: str, logging_level: str = "INFO") -> bool:
+            self._extend_outputs(self.parser.get_all_nodes(), _NODE, _QUALITY)
+            self._extend_outputs(self.parser.get_all_links(), _LINK, _QUALITY)
+    
+    def _extend_outputs(self, names: List[str], object_type: str, property_name: str):
+        """Append one output per element name, continuing the output index sequence"""
+        out_append = self.outputs.append
+        index = len(self.outputs)
+        for name in names:
+            out_append(MappingEntry(index, name, object_type, property_name))
+            index += 1
+    
+    def generate_json(self, output_file: str, logging_level: str = "INFO", compact: bool = False) -> bool:
         """
         Generate JSON configuration file
         
         Args:
             output_file: Path to output JSON file
             logging_level: Logging level (OFF, ERROR, INFO, DEBUG)
+            compact: If True, write JSON without indentation or extra whitespace
         
         Returns:
             True if JSON was generated successfully, False otherwise
         """
         # Always add ElapsedTime as first input
-        all_inputs = [
-            {
-                "index": 0,
-                "name": "ElapsedTime",
-                "object_type": "SYSTEM",
-                "property": "ELAPSEDTIME"
-            }
-        ] + self.inputs
+        all_inputs = [MappingEntry(0, "ElapsedTime", _SYSTEM, _ELAPSEDTIME)] + self.inputs
         
-        # Calculate MD5 hash of .inp file
-        inp_hash = self._calculate_file_hash(self.inp_file)
+        # MD5 hash of .inp file (reuse the one computed while parsing)
+        inp_hash = self.parser.file_hash or self._calculate_file_hash(self.inp_file)
         
-        # Create configuration dictionary
+        # Create configuration dictionary (inputs and outputs are written separately)
         config = {
             "version": "1.0",
             "logging_level": logging_level,
@@ -390,15 +410,26 @@ class MappingGenerator:
             "hydraulic_timestep": self.parser.hydraulic_timestep,
             "_comment": f"IMPORTANT: Set GoldSim Basic Time Step to match hydraulic_timestep ({self.parser.hydraulic_timestep} seconds)",
             "input_count": len(all_inputs),
-            "output_count": len(self.outputs),
-            "inputs": all_inputs,
-            "outputs": self.outputs
+            "output_count": len(self.outputs)
         }
         
-        # Write JSON file
+        # Write JSON file: encode the small header fields, strip its closing brace,
+        # then stream the inputs/outputs arrays entry by entry
+        if compact:
+            encoder = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+            header, key_prefix = encoder.encode(config)[:-1], ','
+        else:
+            encoder = json.JSONEncoder(indent=2, ensure_ascii=False)
+            header, key_prefix = encoder.encode(config)[:-2], ',\n  '
+        key_sep = encoder.key_separator
         try:
-            with open(output_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(output_file, 'w', encoding='utf-8') as f:
+                f.write(header)
+                f.write(f'{key_prefix}"inputs"{key_sep}')
+                _write_mapping_array(f, all_inputs, compact)
+                f.write(f'{key_prefix}"outputs"{key_sep}')
+                _write_mapping_array(f, self.outputs, compact)
+                f.write('}' if compact else '\n}')
             return True
         except Exception as e:
             print(f"ERROR: Failed to write output file: {e}", file=sys.stderr)
@@ -406,44 +437,54 @@ class MappingGenerator:
     
     def _get_object_type(self, element_id: str) -> Optional[str]:
         """Determine object type for an element ID"""
-        if element_id in self.parser.junctions or element_id in self.parser.reservoirs or element_id in self.parser.tanks:
-            return "NODE"
-        elif element_id in self.parser.pipes or element_id in self.parser.pumps or element_id in self.parser.valves:
-            return "LINK"
-        elif element_id in self.parser.patterns:
-            return "PATTERN"
-        else:
-            return None
+        return self._object_types.get(element_id)
     
     def _is_valid_input_property(self, object_type: str, property_name: str) -> bool:
         """Check if property is valid for object type (inputs)"""
-        valid_properties = {
-            "NODE": ["DEMAND"],
-            "LINK": ["STATUS", "SETTING"],
-            "PATTERN": ["MULTIPLIER"]
-        }
-        return property_name in valid_properties.get(object_type, [])
+        return property_name in _INPUT_PROPS.get(object_type, _EMPTY)
     
     def _is_valid_output_property(self, object_type: str, property_name: str) -> bool:
         """Check if property is valid for object type (outputs)"""
-        valid_properties = {
-            "NODE": ["PRESSURE", "HEAD", "DEMAND", "TANKLEVEL", "QUALITY"],
-            "LINK": ["FLOW", "VELOCITY", "HEADLOSS", "STATUS", "SETTING", "QUALITY"]
-        }
-        return property_name in valid_properties.get(object_type, [])
+        return property_name in _OUTPUT_PROPS.get(object_type, _EMPTY)
     
     def _calculate_file_hash(self, filename: str) -> str:
         """Calculate MD5 hash of file"""
-        md5 = hashlib.md5()
         try:
             with open(filename, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    md5.update(chunk)
-            return md5.hexdigest()
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: read/update loop runs in C
+                    return hashlib.file_digest(f, 'md5').hexdigest()
+                
+                # Reuse one buffer rather than allocating bytes per read
+                md5 = hashlib.md5()
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while True:
+                    n = f.readinto(buf)
+                    if not n:
+                        break
+                    md5.update(view[:n])
+                return md5.hexdigest()
         except Exception:
             return "unknown"
 
 
+def _parse_spec(spec: str) -> Tuple[str, str]:
+    """Split an ELEMENT_ID:PROPERTY command-line specification (argparse type)"""
+    element_id, sep, property_name = spec.partition(':')
+    if not sep or not element_id or not property_name or ':' in property_name:
+        raise argparse.ArgumentTypeError(
+            f"invalid specification '{spec}'. Expected format: ELEMENT_ID:PROPERTY")
+    return element_id, property_name
+
+
+def _report_errors(errors: List[str]) -> bool:
+    """Print error messages; return True if there were none"""
+    for error in errors:
+        print(f"ERROR: {error}", file=sys.stderr)
+    return not errors
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -463,9 +504,9 @@ Examples:
     )
     
     parser.add_argument('inp_file', help='Path to EPANET .inp file')
-    parser.add_argument('--input', action='append', dest='inputs', metavar='ELEMENT:PROPERTY',
+    parser.add_argument('--input', action='append', dest='inputs', type=_parse_spec, metavar='ELEMENT:PROPERTY',
                        help='Add an input mapping (can be used multiple times)')
-    parser.add_argument('--output', action='append', dest='outputs', metavar='ELEMENT:PROPERTY',
+    parser.add_argument('--output', action='append', dest='outputs', type=_parse_spec, metavar='ELEMENT:PROPERTY',
                        help='Add an output mapping (can be used multiple times)')
     parser.add_argument('--output-file', default='EpanetBridge.json',
                        help='Output JSON filename (default: EpanetBridge.json)')
@@ -473,6 +514,8 @@ Examples:
                        help='Include water quality outputs for all nodes/links')
     parser.add_argument('--logging-level', default='INFO', choices=['OFF', 'ERROR', 'INFO', 'DEBUG'],
                        help='Set logging level (default: INFO)')
+    parser.add_argument('--compact', action='store_true',
+                       help='Write compact JSON (no indentation or extra whitespace)')
     
     args = parser.parse_args()
     
@@ -506,16 +549,14 @@ Examples:
     # Add custom inputs
     if args.inputs:
         print(f"\nAdding {len(args.inputs)} custom inputs...")
-        for input_spec in args.inputs:
-            if not generator.add_input(input_spec):
-                return 1
+        if not _report_errors(generator.add_inputs_bulk(args.inputs)):
+            return 1
     
     # Add custom outputs or generate defaults
     if args.outputs:
         print(f"\nAdding {len(args.outputs)} custom outputs...")
-        for output_spec in args.outputs:
-            if not generator.add_output(output_spec):
-                return 1
+        if not _report_errors(generator.add_outputs_bulk(args.outputs)):
+            return 1
     else:
         print("\nGenerating default outputs (all tanks, junctions, links)...")
         generator.generate_default_outputs(include_quality=args.quality)
@@ -535,7 +576,7 @@ Examples:
     
     # Generate JSON file
     print(f"\nWriting configuration to: {args.output_file}")
-    if not generator.generate_json(args.output_file, args.logging_level):
+    if not generator.generate_json(args.output_file, args.logging_level, args.compact):
         return 1
     
     print("\nSUCCESS: Configuration file generated successfully!")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Regression test for the EpanetInpParser in scripts/generate_mapping.py
+
+Checks the junction and pipe IDs, hydraulic timestep, water quality flag and
+MD5 file hash extracted from every .inp file in the tree, plus copies of Net1
+with LF, CRLF and CR-only line endings, a UTF-8 byte order mark and quality
+enabled. A parser regression here silently produces an empty mapping file.
+
+Usage:
+    python tests/test_generate_mapping.py
+    (or: python -m pytest tests/test_generate_mapping.py)
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, 'scripts'))
+
+from generate_mapping import EpanetInpParser  # noqa: E402
+
+
+NET1_JUNCTIONS = ['10', '11', '12', '13', '21', '22', '23', '31', '32']
+NET1_PIPES = ['10', '11', '12', '21', '22', '31', '110', '111', '112', '113', '121', '122']
+
+# .inp file -> (junctions, pipes, hydraulic timestep, quality enabled)
+EXPECTED = {
+    'tests/Net1.inp': (NET1_JUNCTIONS, NET1_PIPES, 3600, False),
+    'tests/Pump_to_Tank.inp': (['J2', 'Outlet'], ['2', '1'], 300, False),
+    'tests/multi_junction.inp': ([f'J{i}' for i in range(1, 11)], [f'P{i}' for i in range(1, 13)], 3600, False),
+    'tests/simple_test.inp': (['J1', 'J2'], ['P1', 'P2', 'P3'], 3600, False),
+    'tests/test_data/simple_network.inp': (['J1', 'J2', 'J3'], ['P1', 'P2', 'P3', 'P4'], 3600, False),
+    'tests/test_data/simple_test.inp': (['J1', 'J2'], ['P1', 'P2', 'P3'], 3600, False),
+    'examples/Pump_to_Tank/Pump_to_Tank.inp': (['J2', 'Outlet'], ['2', '1'], 300, False),
+}
+
+
+def _net1_variants():
+    """Get (name, file bytes, quality enabled) for reformatted copies of Net1"""
+    with open(os.path.join(REPO_DIR, 'tests', 'Net1.inp'), 'rb') as f:
+        lf = f.read().replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    # Byte order mark directly in front of the [JUNCTIONS] header (no [TITLE] section)
+    bom_lf = b'\xef\xbb\xbf' + lf[lf.index(b'[JUNCTIONS]'):]
+    return [
+        ('lf', lf, False),
+        ('crlf', lf.replace(b'\n', b'\r\n'), False),
+        ('cr', lf.replace(b'\n', b'\r'), False),
+        ('cr_no_trailing_eol', lf.replace(b'\n', b'\r').rstrip(), False),
+        ('bom_lf', bom_lf, False),
+        ('bom_cr', bom_lf.replace(b'\n', b'\r'), False),
+        ('quality', lf.replace(b'Quality            None', b'Quality            Chemical'), True),
+    ]
+
+
+def _check(path, junctions, pipes, timestep, quality):
+    """Parse path and compare against the expected values; return a list of failures"""
+    parser = EpanetInpParser(path)
+    if not parser.parse():
+        return ['parse() returned False']
+
+    with open(path, 'rb') as f:
+        file_hash = hashlib.md5(f.read()).hexdigest()
+
+    failures = []
+    for label, actual, expected in [
+        ('junctions', parser.junctions, junctions),
+        ('pipes', parser.pipes, pipes),
+        ('hydraulic_timestep', parser.hydraulic_timestep, timestep),
+        ('quality_enabled', parser.quality_enabled, quality),
+        ('file_hash', parser.file_hash, file_hash),
+    ]:
+        if actual != expected:
+            failures.append(f'{label}: expected {expected!r}, got {actual!r}')
+    return failures
+
+
+def test_repository_inp_files():
+    for rel_path, expected in EXPECTED.items():
+        failures = _check(os.path.join(REPO_DIR, rel_path), *expected)
+        assert not failures, f'{rel_path}: {failures}'
+
+
+def test_net1_line_endings_and_bom():
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, data, quality in _net1_variants():
+            path = os.path.join(tmp, f'Net1_{name}.inp')
+            with open(path, 'wb') as f:
+                f.write(data)
+            failures = _check(path, NET1_JUNCTIONS, NET1_PIPES, 3600, quality)
+            assert not failures, f'Net1 ({name}): {failures}'
+
+
+def main():
+    print("=== EpanetInpParser Regression Test ===")
+    failed = 0
+    for test in (test_repository_inp_files, test_net1_line_endings_and_bom):
+        try:
+            test()
+            print(f"[PASS] {test.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"[FAIL] {test.__name__}: {e}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())